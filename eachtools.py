@@ -18,11 +18,28 @@ __author__ = "Justin C. Fisher"
 # * limitations under the License.
 # */
 
-from typing import TypeVar, Generic, Union, Iterable, overload, Tuple, Sequence, Collection, Sized, Mapping, \
+from typing import TypeVar, Generic, Union, Iterable, overload, Tuple, Sequence, Collection, Mapping, \
                    MutableMapping, Callable, Set, Any
 import itertools
+import operator
+from collections import deque
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial, lru_cache
 from math import trunc, floor, ceil
 
+try:  # numpy is optional; without it, the ndarray fast paths below are simply never taken
+    import numpy
+except ImportError:
+    numpy = None
+try:  # numba is optional; without it, each_jit leaves functions as they are
+    import numba
+except ImportError:
+    numba = None
+
 T = TypeVar('T')                          # Used to indicate one-off type relations
 MemberType = TypeVar('MemberType')        # Used to indicate the type of members/values in an EachContainer
 SubmemberType = TypeVar('SubmemberType')  # Used to indicate type of submembers contained within members
@@ -48,49 +65,133 @@ OutputType = TypeVar('OutputType')        # Used to indicate the type of outputs
 
 # === Broadcasting ===
 
+source_kinds = {}  # Caches, for each type seen in broadcasting and indexing, how such sources are treated
+
+def source_kind(source) -> str:
+    """Returns a string indicating how source is to be treated in broadcasting, indexing, and each() itself:
+         'mapping' if source is a Mapping,
+         'set' if it is a Set (like a set or a dictionary's keys view),
+         'collection' if it is some other non-string iterable with a length, like a list or tuple,
+         'iterable' if it is a non-string iterable without a length, like a generator, or
+         'scalar' otherwise (including strings), meaning it is to be broadcast as is.
+       All but 'scalar' sources are "plural", meaning vectorized operations are distributed across their members.
+       The Mapping and Set ABC instance checks this depends upon are relatively slow, so the answer is computed just
+       once for each type of source."""
+    try:
+        return source_kinds[type(source)]
+    except KeyError:
+        if isinstance(source, Mapping):  # Mappings must register with the ABC, so there's no simple duck-typed probe
+            kind = 'mapping'
+        elif isinstance(source, Set):    # Likewise for Sets
+            kind = 'set'
+        elif has_method(source, '__iter__') and not isinstance(source, str):
+            kind = 'collection' if has_method(source, '__len__') else 'iterable'
+        else:
+            kind = 'scalar'
+        source_kinds[type(source)] = kind
+        return kind
+
+def has_method(x, name: str) -> bool:
+    """Returns whether x's type defines the given special method, like the duck-typed __subclasshook__ checks of
+       ABCs like Iterable and Sized, but without the overhead of going through the abc machinery."""
+    return getattr(type(x), name, None) is not None
+
+settable_types = {}  # Caches, for each type of whole altered by in-place ops, whether it supports item assignment
+
+def has_settable_items(whole) -> bool:
+    """Returns whether whole's type supports item assignment, caching the answer for each type, since in-place ops
+       check this each time they alter an EachContainer's whole."""
+    try:
+        return settable_types[type(whole)]
+    except KeyError:
+        answer = settable_types[type(whole)] = has_method(whole, '__setitem__')
+        return answer
+
+def is_mapping(source) -> bool:
+    """Returns whether source is a Mapping, like isinstance(source, Mapping), but using the per-type source_kinds cache."""
+    try:
+        return source_kinds[type(source)] == 'mapping'
+    except KeyError:
+        return source_kind(source) == 'mapping'
+
+def is_plural(source) -> bool:
+    """Returns whether source is a non-string Iterable, whose members will be distributed across in vectorized
+       operations, using the per-type source_kinds cache."""
+    try:
+        return source_kinds[type(source)] != 'scalar'
+    except KeyError:
+        return source_kind(source) != 'scalar'
+
+def is_boolean_mask(values: Iterable) -> bool:
+    """Returns whether each of values is True or False (as is vacuously so if there are none), so that indexing with
+       them selects members rather than listing indices.  The first value's type is checked on its own, so that
+       ordinary index lists are rejected at once, then the rest are checked by a C-level pass collecting their types.
+       values must be re-iterable, like a sequence or a mapping's values view."""
+    for first in values:
+        return type(first) is bool and set(map(type, values)) == {bool}
+    return True
+
+def has_each_members(members: Iterable) -> bool:
+    """Returns whether any of members is an EachContainer, checking just once for each distinct type of member, so
+       that ops with special handling for nested EachContainers can tell when they may skip that handling."""
+    return any(issubclass(t, EachContainer) for t in set(map(type, members)))
+
+def may_yield_each_members(source) -> bool:
+    """Returns whether broadcasting source might yield EachContainers, either because it has some as members (or as
+       values, for mappings), or because it is an EachContainer whose nesting wraps its members in each().
+       Pending DeferredEach sources are presumed to, rather than forcing their computation to find out."""
+    if isinstance(source, EachContainer):
+        if source._each_nested is next or source._each_nested > 1: return True
+        if isinstance(source, DeferredEach) and source.is_pending: return True
+        source = source.whole
+    return has_each_members(source.values() if is_mapping(source) else source)
+
 def as_sized_iterable(source) -> Collection:
     """Returns a version of source that is sized and iterable (i.e. that is a Python "Collection").
        If source is a scalar (string or non-iterable), it is returned, wrapped in a tuple.
        If source is a non-string iterable with a computable length, it is returned as is.
        If source is iterable without a computable length (e.g a generator), it is spieled into a tuple and returned."""
-    if isinstance(source, str): return (source,)
-    try:
-        length = len(source)
-        # TODO should we worry about the possibility of sized but non-iterable sources?
-        return source
-    except:
-        return tuple(source) if isinstance(source, Iterable) else (source,)
+    kind = source_kind(source)
+    if kind == 'scalar': return (source,)
+    if kind == 'iterable': return tuple(source)
+    return source
 
 def broadcast_to_length(source, n):
     """Returns an iterator of n items drawn from source.  If source has that length, it will be iterated.
        If source has length 1, its one member will be repeated.  Otherwise source itself will be repeated."""
     # TODO this won't itself unspiel an Iterator and check its length.  Is that fine?
-    try:
-        length = len(source)
-    except:
-        length = None
+    length = len(source) if has_method(source, '__len__') else None
     if length == n:
         return iter(source)
     if length == 1:
-        return itertools.repeat(next(source), n)
+        return itertools.repeat(next(iter(source)), n)
     return itertools.repeat(source, n)
 
-def broadcast_to_indices(source:Collection, n: int, indices: Iterable) -> Iterable:
+def broadcast_to_indices(source:Collection, n: int, indices: Iterable, model: Collection = None,
+                         length: int = None) -> Iterable:
     """Returns an iterator of n items drawn from source.
-         If source is a Mapping, items in it will be looked up by the given indices.
+         If source is the given model Mapping, whose keys are the indices, its values will be iterated as they are.
+         If source is another Mapping, items in it will be looked up by the given indices.
          Otherwise, if source has length 1, its one member will be repeated n times.
          Otherwise, if indices is not a range object, items will be looked up by the given indices.
          Otherwise, indices are a range object, but if source has insufficient length, a ValueError will be raised.
-         Otherwise source itself will be iterated."""
-    if isinstance(source, Mapping):
+         Otherwise source itself will be iterated.
+       If the caller has already found len(source), it may pass this as length, to save finding it again."""
+    if is_mapping(source):
+        if source is model and not isinstance(indices, range):  # model's values already align with its keys
+            return iter(source.values())
+        if isinstance(source, EachMapping) and not isinstance(source, EachSet):
+            source = source.whole  # look up keys directly, rather than via EachContainer.__getitem__'s index parsing
         return (source[i] for i in indices)
-    length = len(source)
+    if length is None: length = len(source)
     if length == 1:
         return itertools.repeat(next(iter(source)), n)
     if not isinstance(indices, range):  # TODO will this case ever trigger?
         return (source[i] for i in indices)  # will raise error if source lacks __getitem__
     if length < n:
         raise ValueError(f"{source} has length {length}, so cannot be broadcast to length {n}.")
+    if isinstance(source, DeferredEach) and source.is_pending:
+        return source.values()  # pull values through a deferred computation without storing them
     if isinstance(source, EachContainer):
         return source.values()  # will iterate the values, perhaps wrapping in each() due for nested settings
     # TODO this presumes that simply iterating source is equivalent to accessing indices 0..(n-1).  Generalize?
@@ -123,6 +224,28 @@ def broadcast_to_indices(source:Collection, n: int, indices: Iterable) -> Iterab
 # def broadcast_together(self, other:OtherType) -> Iterable[Tuple[MemberType, OtherType]]: ...
 # @overload  # broadcast_together(self, matching_sequence) returns an iterable of (member, othermember) tuples
 # def broadcast_together(self, other:Sequence[OtherType]) -> Iterable[Tuple[MemberType,OtherType]]: ...
+def broadcast_layout(sources: Tuple[Collection, ...], match_first = False):
+    """Introspects the given sized sources in a single pass, and returns a tuple (model, n, indices, lengths) telling
+       how they will be broadcast together:  the model is the source whose length n others will be broadcast to (the
+       first source if match_first, or otherwise the first source that can't be broadcast, either due to non-1 size
+       or to being a Mapping); indices are the model's keys if it and all non-broadcastable sources are Mappings, or
+       otherwise range(n); and lengths contains the length of each source, so these needn't be found again."""
+    lengths = tuple(map(len, sources))
+    maps = tuple(map(is_mapping, sources))
+    m = 0
+    if not match_first:
+        for i, length in enumerate(lengths):
+            if length != 1 or maps[i]:
+                m = i
+                break
+    model = sources[m]
+    n = lengths[m]
+    # If the model and all non-broadcastable sources are Mappings we'll use the model's keys as our indices
+    if maps[m] and all(length == 1 or is_map for length, is_map in zip(lengths, maps)):
+        return model, n, model.keys(), lengths
+    # otherwise we'll use integer indices ranging 0...(n-1) and expect any involved mappings to have these as keys
+    return model, n, range(n), lengths
+
 def broadcast_together(*sources, match_first = False):
     """Returns an iterator of tuples (m0, m1, ...), where each m will be drawn from the corresponding source,
        broadcasting each source as needed.  If match_first, then other sources will be broadcast to match the
@@ -150,22 +273,22 @@ def broadcast_together(*sources, match_first = False):
 
     if not sources: return ()
     sources = tuple(as_sized_iterable(s) for s in sources)
-
-    # Identify the model whose length n we will broadcast singletons to
-    if match_first:
-        model = sources[0]
-    else:
-        # The model will be the first source that can't be broadcast, either due to non-1 size or to being a Mapping
-        model = next((s for s in sources if len(s) != 1 or isinstance(s, Mapping)), sources[0])
-    n = len(model)
-
-    # If the model and all non-broadcastable sources are Mappings we'll use the model's keys as our indices
-    if isinstance(model,Mapping) and all(len(s)==1 or isinstance(s, Mapping) for s in sources):
-        indices = model.keys()
-    else: # otherwise we'll use integer indices ranging 0...(n-1) and expect any involved mappings to have these as keys
-        indices = range(n)
-
-    return zip(*(broadcast_to_indices(s, n, indices) for s in sources))
+    model, n, indices, lengths = broadcast_layout(sources, match_first)
+    if isinstance(indices, range) and not any(map(is_mapping, sources)):
+        # In the common case with no Mappings, each source is simply iterated, or has its lone member repeated
+        columns = []
+        for s, length in zip(sources, lengths):
+            if length == 1:
+                columns.append(itertools.repeat(next(iter(s)), n))
+            elif length < n:
+                raise ValueError(f"{s} has length {length}, so cannot be broadcast to length {n}.")
+            else:
+                columns.append(s.values() if isinstance(s, EachContainer) else s)
+        return zip(*columns)
+    if len(sources) == 2:
+        return zip(broadcast_to_indices(sources[0], n, indices, model, lengths[0]),
+                   broadcast_to_indices(sources[1], n, indices, model, lengths[1]))
+    return zip(*[broadcast_to_indices(s, n, indices, model, length) for s, length in zip(sources, lengths)])
 
     # lengths = set(len(s) for s in sources)  # Should be {1}, {n}, or {1, n}
     # if match_first:
@@ -192,10 +315,17 @@ def broadcast_args(fn, args, kwargs, match_first = False):
        EachContainer of bound methods), each a will be a tuple drawn from args, and each k will be a dictionary
        based on kwargs.  All of these will be broadcast as appropriate, to match the size of fn if match_first is true,
        or to match their agreed-upon length other than 1 otherwise.  If sources disagree upon their preferred length,
-       a ValueError will be raised."""
+       a ValueError will be raised.  When there are no kwargs, every k will be the same empty dictionary, so callers
+       should unpack each k with ** rather than altering it."""
     # We will string these together, pass them into broadcast_together, then package the results it yields into a triple
-    start_k = 1 + len(args) + 1  # fn takes 1, args take len(args), kwargs take the rest
-    return ((f_a_k[0], f_a_k[1:start_k], {key:value for key,value in zip(kwargs.keys(), f_a_k[start_k:])})
+    if not kwargs:  # In the common case without kwargs, all triples can share one empty dict, unpacked by callers
+        no_kwargs = {}
+        if len(args) == 1:
+            return ((f, (a,), no_kwargs) for f, a in broadcast_together(fn, args[0], match_first=match_first))
+        return ((f_a[0], f_a[1:], no_kwargs) for f_a in broadcast_together(fn, *args, match_first=match_first))
+    start_k = 1 + len(args)  # fn takes 1, args take len(args), kwargs take the rest
+    keys = tuple(kwargs.keys())
+    return ((f_a_k[0], f_a_k[1:start_k], dict(zip(keys, f_a_k[start_k:])))
             for f_a_k in broadcast_together(fn, *args, *(kwargs.values()), match_first=match_first))
 
 
@@ -205,35 +335,48 @@ class BroadcastHandler:
         This creates a sized iterable version of each source (spieling iterables into tuples if needed), introspects
         the sources to determine B.n the length of their broadcast version and B.indices the keys/indices that will
         be matched across distributed sources, either range(n) when sequence-like sources are involved, or the
-        keys of an involved dictionary.
+        keys of an involved dictionary, as B.is_range records.
         `for tup in B` will yield successive n-tuples of values drawn from each source, broadcasting as needed.
         `B(it)` will return a new EachContainer containing the output of such a broadcast operation, where it is an
         iterator of successive values to be stored in this output container.  If B.indices is a range, this output will
         be an EachContainer of sources[0]._each_output_type.  Otherwise it will be an EachMapping mapping each
         of B.indices to the corresponding value.
-        This allows overloaded functions like EachContainer.__add__ to simply create B, and define a generator to
-        iterate through broadcast values from the sources and yield the resulting value (in this case their sum), and
-        let B do the rest, e.g. with `return B(s + o for s, o in B)`.  Having __add__ define its own iterator allows
-        the inner loop of a vectorized operation to occur without any function calls, for efficiency."""
+        This allows overloaded functions like EachContainer.__add__ to simply create B, and use a list comprehension to
+        iterate through broadcast values from the sources and compute the resulting value (in this case their sum), and
+        let B do the rest, e.g. with `return B([s + o for s, o in B])`.  Having __add__ define its own loop allows
+        the inner loop of a vectorized operation to occur without any function calls, for efficiency, and B will
+        adopt a freshly built list as is, rather than copying it or growing a new one from a generator.
+        `B.apply(op)` is shorthand for `B(op(s, o) for s, o in B)`, for C-level ops like operator.add, except that when
+        B.E wraps a numeric ndarray and the other sources are numeric too, op is applied just once to the whole arrays,
+        letting numpy do the elementwise work.  `B.apply_in_place(op)` similarly stands in for `B.in_place(...)`."""
+    # A BroadcastHandler is created for each vectorized op, so slots keep it small and its attributes quick to read
+    __slots__ = ('sources', 'E', 'model', 'n', 'indices', 'lengths', 'is_range')
+
     def __init__(B, *sources, match_first = False):
         # TODO consider allowing iterable sources, construing them as non-broadcastable (tricky if one ends up being model)
-        sources = tuple(as_sized_iterable(s) for s in sources)
-        B.sources = sources
-        B.E = sources[0]  # type: EachContainer
-
-        # Identify the model whose length n we will broadcast singletons to
-        if match_first:
-            B.model = sources[0]
+        if len(sources) != 2:
+            B.sources = tuple(as_sized_iterable(s) for s in sources)
+            B.E = B.sources[0]  # type: EachContainer
+            B.model, B.n, B.indices, B.lengths = broadcast_layout(B.sources, match_first)
+            B.is_range = isinstance(B.indices, range)
+            return
+        # Binary ops are by far the most common, so we unroll broadcast_layout for them
+        E, other = B.sources = sources[0], as_sized_iterable(sources[1])
+        B.E = E  # type: EachContainer
+        E_length, other_length = B.lengths = len(E), len(other)
+        if match_first or E_length != 1 or is_mapping(E):
+            B.model, B.n = E, E_length
+        elif other_length != 1 or is_mapping(other):
+            B.model, B.n = other, other_length
         else:
-            # The model will be the first source that can't be broadcast, either due to non-1 size or to being a Mapping
-            B.model = next((s for s in sources if len(s) != 1 or isinstance(s, Mapping)), sources[0])
-        B.n = len(B.model)
-
+            B.model, B.n = E, 1
         # If the model and all non-broadcastable sources are Mappings we'll use the model's keys as our indices
-        if isinstance(B.model, Mapping) and all(len(s) == 1 or isinstance(s, Mapping) for s in sources):
+        if is_mapping(B.model) and (E_length == 1 or is_mapping(E)) and (other_length == 1 or is_mapping(other)):
             B.indices = B.model.keys()
+            B.is_range = False
         else:  # otherwise we'll use integer indices ranging 0...(n-1) and expect any involved mappings to have these as keys
             B.indices = range(B.n)
+            B.is_range = True
 
     # TODO figure out how to @overload these to properly type-hint the EachMapping possibility
     def __call__(B, it:Iterable[Callable[[Any], OutputType]]) -> 'EachContainer[OutputType]':
@@ -244,43 +387,180 @@ class BroadcastHandler:
         #  eachification down the chain, so the content should now have been appropriately eachified, and then
         #  that eachification should persist through whatever operation was performed on them, so the outermost
         #  layer of the new output can assume that its contents are eachified enough, so can have nested = 1
-        if isinstance(B.indices, range):
-            return B.E._each_output_type(list(it), nested=1)
-        return EachMapping({key: value for key, value in zip(B.indices, it)}, nested=1)
+        if B.is_range:  # a freshly built list, e.g. from a list comprehension, is used as is
+            members = it if type(it) is list else list(it)
+            assert len(members) == B.n, f"Broadcasting to length {B.n} produced {len(members)} values."
+            return B.E._each_output_type(members, nested=1)
+        return EachMapping(dict(zip(B.indices, it)), nested=1)
 
     # TODO figure out how to @overload these to properly type-hint the EachMapping possibility
     def in_place(B, it:Iterable[MemberType]) -> 'EachContainer[MemberType]':
         E = B.E
-        if hasattr(type(E.whole), '__setitem__'):    # If E.whole's items are settable, we'll alter each in place
+        if B.is_range and type(E.whole) is list and B.n == len(E.whole):  # Lists can replace all members in one C call
+            E.whole[:] = it
+        elif has_settable_items(E.whole):            # If E.whole's items are settable, we'll alter each in place
             for index, value in zip(B.indices, it):
                 E.whole[index] = value
-        else:                                        # Otherwise we'll replace E.whole with new content
-            E.whole = E._each_output_type(it)
-        return E  # in place operations require that the first operand be returned
+        else:  # Like Python's immutables, an unalterable whole (e.g. a shared E.key range) yields a new container,
+            return B(it)  # of the same sort that B.apply would return
+        return E  # in place operations on alterable wholes return the first operand
+
+    def apply(B, op: Callable[..., OutputType], reflected: bool = False,
+              array_op: Callable = None) -> 'EachContainer[OutputType]':
+        """Returns a new EachContainer containing op(m0, m1, ...) for each tuple of values broadcast from the sources,
+           or op(m1, m0) if reflected, as needed for reflected operators like __radd__.  If the sources are backed by
+           numpy ndarrays, array_op (default op) is applied to whole arrays at once, for ops like math.floor whose
+           numpy counterpart differs from the scalar function."""
+        if B.is_range:
+            arrays = ndarray_operands(B.sources, B.n)
+            if arrays is not None:
+                if array_op is None: array_op = op
+                result = array_result(array_op, *arrays[::-1]) if reflected else array_result(array_op, *arrays)
+                if isinstance(result, numpy.ndarray) and result.shape == (B.n,):  # not e.g. matmul's dot product
+                    return EachArray(result)
+        if not B.n:  # Empty results, e.g. from ops on filtered-out containers, need no per-member machinery
+            return B([])
+        if B.is_range and deferring.get():
+            return DeferredEach(B, op, reflected)
+        columns = B.columns()
+        return B(map(op, *columns[::-1]) if reflected else map(op, *columns))
+
+    def apply_in_place(B, op: Callable[..., MemberType]) -> 'EachContainer[MemberType]':
+        """Alters B.E in place, replacing each of its members m0 with op(m0, m1, ...), broadcasting the other sources."""
+        if not B.n: return B.E  # There are no members to alter
+        if B.is_range:
+            arrays = ndarray_operands(B.sources, B.n)
+            # Only a whole that is itself E's ndarray operand can be filled in one step, not e.g. a list that was
+            # converted to an ndarray operand, or one reduced to a scalar operand (e.g. from a length-1 list)
+            whole = B.E.whole
+            if arrays is not None and arrays[0] is whole and len(whole) == B.n:
+                result = array_result(op, *arrays)
+                # Results that would lose information when cast into E's array, like complex into float, go member
+                # by member instead, so their assignment fails or narrows the same way a single member's would
+                if isinstance(result, numpy.ndarray) and result.shape == (B.n,) \
+                        and numpy.can_cast(result.dtype, whole.dtype, 'same_kind'):
+                    whole[:] = result
+                    return B.E
+        return B.in_place(map(op, *B.columns()))
+
+    def columns(B) -> Tuple[Iterable, ...]:
+        """Returns a tuple containing an iterator for each source, yielding its B.n values, broadcasting as needed."""
+        if len(B.sources) == 2:
+            E, other = B.sources
+            E_length, other_length = B.lengths
+            return (broadcast_to_indices(E, B.n, B.indices, B.model, E_length),
+                    broadcast_to_indices(other, B.n, B.indices, B.model, other_length))
+        return tuple(broadcast_to_indices(s, B.n, B.indices, B.model, length) for s, length in zip(B.sources, B.lengths))
 
     def __iter__(B):
-        return zip(*(broadcast_to_indices(s, B.n, B.indices) for s in B.sources))
+        return zip(*B.columns())
+
+
+def apply_unary(E: 'EachContainer', op: Callable[[Any], OutputType],
+                array_op: Callable = None) -> 'EachContainer[OutputType]':
+    """Returns `BroadcastHandler(E).apply(op, array_op=array_op)`, as used by unary ops like `-E` and `abs(E)`.
+       When E.whole is a plain list or tuple of more than one member, with no nesting to propagate and no deferral
+       in effect, there is nothing to broadcast, so op is simply mapped over it, without building a BroadcastHandler.
+       (A lone member is left to BroadcastHandler, which distributes it if it is itself an EachContainer.)"""
+    whole = E.whole
+    if type(whole) in (list, tuple) and len(whole) != 1 and E._each_nested == 1 and not deferring.get():
+        return E._each_output_type(list(map(op, whole)), nested=1)
+    return BroadcastHandler(E).apply(op, array_op=array_op)
+
+def wrapped_ndarray(source):
+    """Returns the numpy ndarray that source is or wraps in an EachContainer, or None if there is none."""
+    if isinstance(source, DeferredEach) and source.is_pending: return None  # don't force computation
+    if isinstance(source, EachContainer): source = source.whole
+    return source if isinstance(source, numpy.ndarray) else None
+
+def is_numeric_scalar(x) -> bool:
+    """Returns True if x is a Python or numpy number, which numpy will combine with each member of an array."""
+    return isinstance(x, (int, float, complex)) or (isinstance(x, numpy.generic) and x.dtype.kind in 'biufc')
+
+def ndarray_operand(source, n: int):
+    """Returns a version of source that numpy can combine elementwise with other length-n operands in a way that
+       matches each-broadcasting, or None if there is no such version.  Numeric scalars are returned as is, as is the
+       lone member of a length-1 tuple or list that contains just a numeric scalar.  1-dimensional numeric ndarrays of
+       length n or 1 are returned as is, or extracted from an EachContainer that wraps one, and length-n lists,
+       tuples and ranges of numbers are converted to such ndarrays.  A singleton whose lone member is itself plural,
+       like `[[10, 20, 30]]`, has no such version, since each-broadcasting adds that whole member to each member,
+       e.g. making `each(array([1., 2.])) + [[10, 20]]` yield `each(array([11., 21.]), array([12., 22.]))`."""
+    if isinstance(source, DeferredEach) and source.is_pending: return None  # don't force computation
+    if isinstance(source, EachContainer): source = source.whole
+    if isinstance(source, (tuple, list)) and len(source) == 1:
+        # a singleton's lone member is broadcast as is, so numpy can use it only if it's a numeric scalar
+        source = source[0]
+        return source if is_numeric_scalar(source) else None
+    if is_numeric_scalar(source):
+        return source
+    if isinstance(source, (tuple, list, range)) and len(source) == n:
+        try:
+            source = numpy.asarray(source)
+        except ValueError:  # e.g. due to members being sequences of differing lengths
+            return None
+    if isinstance(source, numpy.ndarray):
+        if source.ndim == 1 and source.dtype.kind in 'biufc' and len(source) in (n, 1): return source
+    return None
+
+def ndarray_operands(sources, n: int, convert: bool = False) -> Union[Tuple, None]:
+    """If at least one source is (or wraps) an ndarray, and every source has an ndarray_operand version, returns a
+       tuple of these, so numpy can do a whole vectorized operation in one C loop, broadcasting as each would.
+       Otherwise returns None.  If convert is true, sequences of numbers will be converted to ndarrays even if no
+       source was one already, which is worthwhile when the op would otherwise be costly to call member by member,
+       as for ufuncs and each_jit functions, whereas a simple arithmetic op costs less than the conversion would."""
+    if numpy is None: return None
+    if not convert and all(wrapped_ndarray(s) is None for s in sources): return None
+    operands = []
+    for s in sources:
+        operand = ndarray_operand(s, n)
+        if operand is None: return None
+        operands.append(operand)
+    if convert and not any(isinstance(operand, numpy.ndarray) for operand in operands): return None
+    return tuple(operands)
+
+def array_result(op: Callable, *arrays):
+    """Returns op(*arrays) as computed by numpy in one vectorized call, or None if numpy couldn't compute it as each
+       would member by member, e.g. if op isn't one numpy can vectorize, a result wouldn't fit numpy's fixed-width
+       ints, or some member op would raise, like an int's negative power or a division by zero.  Falling back then
+       lets the member-by-member path give Python's own results, or raise Python's own errors.  (numpy doesn't flag
+       overflow within int arrays, so that still wraps around, as noted in EachArray's docstring.)"""
+    try:
+        with numpy.errstate(divide='raise', over='raise', invalid='raise'):
+            return op(*arrays)
+    except (TypeError, ValueError, OverflowError, FloatingPointError):
+        return None
+
+def rounded_to_ints(array, array_op: Callable):
+    """Returns array_op(array) as an int64 array, where array_op is numpy.trunc, floor or ceil, so that, like
+       math.trunc, floor and ceil, these yield integers usable as indices.  If some results wouldn't fit in int64,
+       e.g. NaNs or infinities, TypeError is raised, so apply will fall back to the math functions member by member."""
+    if array.dtype.kind in 'iu': return array.copy()  # already integers, as math.floor would leave them
+    result = array_op(array)
+    if not numpy.all(numpy.abs(result) < 2.0 ** 63):
+        raise TypeError("Some rounded values don't fit in int64.")
+    return result.astype(numpy.int64)
 
 
 def repeat_if_singular(source)->Iterable:
     """If source is a string or non-iterable scalar, it will be repeatedly yielded, indefinitely.
        If source is an iterable that yields just one value, that value will be repeatedly yielded, indefinitely.
-       Otherwise, this is equivalent to iterating source."""
+       Otherwise, this is equivalent to iterating source.  The returned iterator is built from itertools parts, so
+       yielding values involves no Python-level generator, but this means up to two values are drawn from source
+       immediately, to tell which case applies, rather than when the iterator is first advanced."""
     # If source is a string or non-iterable scalar, we'll simply broadcast/repeat it
-    if not isinstance(source, Iterable) or isinstance(source, str):
-        while True: yield source
+    if not is_plural(source):
+        return itertools.repeat(source)
     source = iter(source)
     try:
         first_value = next(source)
     except StopIteration:  # if there is no first value, there's nothing to repeat!
-        return
-    yield first_value
+        return iter(())
     try:
         second_value = next(source)
     except StopIteration:  # If there is no second value, then we'll simply broadcast/repeat the first_value
-        while True: yield first_value
-    yield second_value  # If there are at least two values, we'll just yield all the values from the source
-    yield from source
+        return itertools.repeat(first_value)
+    # If there are at least two values, we'll just yield all the values from the source
+    return itertools.chain((first_value, second_value), source)
 
 # def with_matched_args(self, args, kwargs) -> Iterable[Tuple[MemberType, Tuple, dict[str, any]]]:
 #     """Returns an iterator of (m, a, k) triples, where each m will be a successive member of self,
@@ -305,6 +585,32 @@ def repeat_if_singular(source)->Iterable:
 #     # returned iterator will yeild (m, a, k) tuples: m = next member of self, a = tuple of args, k = dict of kwargs
 #     return zip(self, args_it, kw_dicts_it)
 
+# Cached attrgetter(name) instances, so repeatedly distributing the same attribute, as in chains like
+# `each(X).foo().bar()`, reuses one C-level getter per name rather than building a new one per access.
+attribute_getter = lru_cache(maxsize=1024)(operator.attrgetter)
+
+# Cached EachContainer(range(n)) for each length n, returned by E.key, so sibling containers of one length share one
+index_container = lru_cache(maxsize=256)(lambda n: EachContainer(range(n)))
+
+
+# === Parallel distribution ===
+
+parallel_threshold = None  # If set to an int n, calls distributed over n or more members will use parallel_map
+
+def parallel_map(fn: Callable[[T], OutputType], items: Sequence[T], workers: int = None) -> list:
+    """Returns a list of fn(item) for each item in items, splitting items into contiguous chunks that are processed
+       by a pool of threads.  This helps only when fn spends much of its time outside of Python's GIL, e.g. waiting
+       on I/O or running numpy or numba-compiled code.  It is used by `E.method(args)` and `each(fn)(args)` when
+       eachtools.parallel_threshold is set and there are at least that many calls to distribute."""
+    if not items: return []
+    workers = workers or os.cpu_count() or 1
+    size = -(-len(items) // workers)  # ceiling division, so there are at most `workers` chunks
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        results = pool.map(lambda chunk: list(map(fn, chunk)), chunks)
+        return list(itertools.chain.from_iterable(results))
+
+
 # === each factory ===
 
 #TODO add kwargs to each overloading?
@@ -319,7 +625,7 @@ def each(m: MutableMapping[KeyType, MemberType]) -> 'EachMapping[KeyType, Member
 @overload
 def each(m1:MemberType, m2:MemberType, *members: MemberType) -> 'EachContainer[MemberType]': ...
 # Another possibility is each(m1:MemberType, enlist=False) -> 'MemberType'  # left undeclared to not confuse linters
-def each(*members, nested: Union[int, bool, None] = next, enlist = True) \
+def each(*members, nested: Union[int, bool, None] = next, enlist = True, dtype = None) \
         -> Union['EachContainer', 'EachMapping', 'EachSet']:
     """`each(object)` returns an "each-wrapped object" which for many purposes behaves like the wrapped object itself,
        except that most operations involving each-wrapped objects will be distributed over containers' members,
@@ -327,10 +633,13 @@ def each(*members, nested: Union[int, bool, None] = next, enlist = True) \
        **EachContainers**:
        `each(collection)` returns an each-wrapped version of the given (iterable and sized) collection.
        `each(iterator)` spiels an unsized iterable (like a generator expression) into each(list(iterator)) if `enlist`
-       is its default value True; TODO otherwise NotImplemented
+       is its default value True; otherwise it returns an EachIterable that streams members from the iterator when
+       iterated, and spiels them into a list only when something else needs them.
        `each(member1, member2, ...)` creates an each-wrapped list of the given members.
        `each(member1)` for scalar member1 is equivalent to `each([member1])` if `enlist` is its default value True;
         otherwise this will return member1 as is.
+       `each(iterable, dtype=float)` stores numeric members compactly in a numpy array of the given dtype (rather than
+        as a list of separate Python objects), so vectorized ops on them can be done by numpy. (This requires numpy.)
        `each(1, 2, 3) * 5` multiplies each member by 5, yielding each(5, 10, 15). (I.e. it "broadcasts" the 5.)
        `each(1, 2, 3) + (2, 3, 4)` does vectorized or pairwise addition, yielding each(3, 5, 7).
        `each(motors).velocity` returns the .velocity of each motor (in an each-wrapped list)
@@ -374,7 +683,8 @@ def each(*members, nested: Union[int, bool, None] = next, enlist = True) \
        `each(rows, nested=2)` will distribute ops over two levels (each cell of each row) but not further.
        `each(rows, nested=True)` will distribute ops all the way down, good for traversing trees of arbitrary depth.
        `each(C, nested=None)` and `each(C, nested=1)` treat C eachwise, but do not add further eaching, even if C
-       is already an EachContainer (unlike the default `nested=next` which would add a layer of eaching).
+       is already an EachContainer (unlike the default `nested=next` which would add a layer of eaching).  So if C
+       is already an EachContainer that distributes at least as deeply as `nested` asks, C itself is returned.
        `each(C).each.attr` is short for `each(each(C).attr, nested=1)` or for `each(each(m.attr, nested=1) for m in C`.
        In all these cases, if submembers like rows' cells were already EachContainers then ops on them will be
        distributed for that reason, even if a higher-level `nested` setting was not causing them to be distributed.
@@ -398,39 +708,102 @@ def each(*members, nested: Union[int, bool, None] = next, enlist = True) \
        `each('A', 'B') + [each('1', '2')]` distributes the letters on the outermost dimension, but encapsulates the
        numbers so they are distributed on an inner dimension, returning `each(each('A1','A2'), each('B1','B2'))`.
        (This serves a similar purpose to using numpy.reshape to alter which dimension an array will broadcast at.)"""
+    if dtype is not None:
+        if numpy is None: raise ImportError("each(..., dtype=...) requires numpy, which could not be imported.")
+        source = members[0] if len(members) == 1 and is_plural(members[0]) else members
+        if isinstance(source, EachContainer): source = source.whole
+        if isinstance(source, str) or source_kind(source) in ('mapping', 'set'):
+            raise TypeError(f"each(..., dtype=...) needs sequence-like members, not {type(source).__name__}.")
+        return EachArray(source, dtype=dtype)
     if nested is True or nested is all: nested = float('inf')
     if nested is None or nested is False: nested = 1
     if len(members) == 1 and not isinstance(members[0], str):
         source = members[0]
-        if isinstance(source, Iterable):
+        kind = source_kind(source)  # cached for each type, so we needn't repeat slow ABC checks on each call
+        if kind != 'scalar':
             if isinstance(source, EachContainer):
-                if nested is not next: nested = max(nested, source._each_nested)
+                if nested is not next and source._each_nested is not next:
+                    if nested <= source._each_nested:  # Rewrapping would add nothing, and would lose what
+                        return source                      # subclasses like EachArray and DeferredEach add
+                    nested = max(nested, source._each_nested)
                 source = source.whole
+                kind = source_kind(source)
             else:
                 if nested is next: nested = 1  # Source itself is the "next"/only non-EachContainer to be eachified
-            if isinstance(source, Set):
-                return EachSet(source, nested=nested)
-            if isinstance(source, Mapping):
-                return EachMapping(source, nested=nested)
-            if not isinstance(source, Sized):
+            if kind == 'iterable':
                 if enlist:
                     return EachContainer(list(source), nested=nested)
-                else:
-                    raise NotImplementedError  # TODO allow a version of EachIterable
-            return EachContainer(source, nested=nested)
+                return EachIterable(source, nested=nested)
+            return each_types[kind](source, nested=nested)
         if not enlist:
             return source  # if source is non-eachable scalar and we aren't supposed to enlist it, return it as is
     if nested is next: nested = 1  # This will be the "next"/only non-EachContainer to be eachified
     return EachContainer(list(members), nested=nested)
 
 
+vectorized_functions = {}  # Maps id(f) to f for each elementwise function f made by each_jit
+
+def each_jit(fn: Callable[..., OutputType]) -> Callable[..., OutputType]:
+    """`@each_jit` marks fn as an elementwise numeric function whose each-distributed calls can be vectorized.
+       If numba is available, fn is compiled with numba.vectorize, so `each(fn)(E1, E2)` runs as one compiled
+       loop over whole numeric arrays, with no intermediate arrays for the steps within fn, rather than calling fn
+       once per member.  Numeric lists are converted to arrays for this, as the per-member calls would cost more.
+       Without numba, fn is returned as is, and `each(fn)` will distribute calls to it member by member, as usual.
+       numpy ufuncs like numpy.sqrt are treated as vectorized in this way without needing to be marked."""
+    if numba is None: return fn
+    vectorized = numba.vectorize(fn)
+    vectorized_functions[id(vectorized)] = vectorized  # this reference also keeps id(vectorized) from being reused
+    return vectorized
+
+def is_vectorized(fn) -> bool:
+    """Returns True if fn is a numpy ufunc, or was compiled by each_jit, so can be applied to whole arrays at once."""
+    return id(fn) in vectorized_functions or (numpy is not None and isinstance(fn, numpy.ufunc))
+
+
 # === EachAttributeGetter ===
 
+# `E.each.attr` installs a descriptor for attr on EachAttributeGetter, and, like attribute_getter's lru_cache, keeps at
+# most this many, removing the oldest first, so names generated at runtime can't grow the class dict without bound
+max_attribute_descriptors = 1024
+attribute_descriptor_names = {}  # each installed name, in order of installation
+
+# When an installed descriptor's lookup raises AttributeError, Python retries it via __getattr__, which would compute
+# each member's attr all over again, so the descriptor leaves (getter, attr, error) here for __getattr__ to re-raise
+failed_attribute_lookup = ContextVar('failed_attribute_lookup', default=None)
+
 class EachAttributeGetter:
     """`each(X).each.attr` returns a nested structure of EachContainers, equivalent to `each(each(x.attr) for x in X)`.
-       An EachAttributeGetter is returned by `each(X).each` and mediates getting each versions of attributes."""
+       An EachAttributeGetter is returned by `each(X).each` and mediates getting each versions of attributes.
+       Each member's attribute is each-wrapped only as the outer EachContainer distributes an operation over it."""
+
+    # One of these is created for each `each(X).each` expression, so slots keep it small
+    # The slot is private, so it won't shadow members' own .container attrs in `E.each.container`
+    __slots__ = ('_container',)
 
-    # TODO NotImplemented
+    def __init__(self, container: 'EachContainer'):
+        self._container = container
+
+    def __getattr__(self, attr):
+        failure = failed_attribute_lookup.get()
+        if failure is not None:
+            failed_attribute_lookup.set(None)
+            if failure[0] is self and failure[1] == attr: raise failure[2]
+        # Falling back to __getattr__ is the slowest path of attribute lookup, so upon first use of each attr, we
+        # install a descriptor for it on this class, which later `E.each.attr` lookups will find directly.
+        # attr is interned, in case it was built at runtime, so members' attr lookups can match it by identity
+        attr = sys.intern(attr)
+        result = each_attribute(self._container, attr)
+        # Descriptors are installed only once members have been found to have attr, so failed lookups, like typos,
+        # don't accumulate on the class.  (A pending DeferredEach hasn't looked at its members yet.)
+        if not attr.startswith('__') and attr not in EachAttributeGetter.__dict__ and len(result) \
+                and not (isinstance(result, DeferredEach) and result.is_pending):
+            setattr(EachAttributeGetter, attr, EachAttributeDescriptor(attr))
+            attribute_descriptor_names[attr] = None
+            if len(attribute_descriptor_names) > max_attribute_descriptors:
+                oldest = next(iter(attribute_descriptor_names))
+                del attribute_descriptor_names[oldest]
+                delattr(EachAttributeGetter, oldest)
+        return result
 
     # TODO consider what `each(each(X))` should return?
     #  One plausible rule says that each(foo) always returns a container much like foo, except many operations will be
@@ -458,6 +831,117 @@ class EachAttributeGetter:
     #  into nested iterables!
 
 
+class EachAttributeDescriptor:
+    """An EachAttributeDescriptor is installed on the EachAttributeGetter class for each attr that has been gotten
+       via `E.each.attr`, making later uses of `E.each.attr` quicker than falling back to __getattr__ would be."""
+
+    __slots__ = ('attr', 'attr_getter')
+
+    def __init__(self, attr: str):
+        self.attr = attr
+        self.attr_getter = attribute_getter(attr)  # held here, so gets needn't look it up in the lru_cache each time
+
+    # A plain positional-only signature, without *args or closures, lets the interpreter call this by its fast path
+    def __get__(self, getter, owner=None, /):
+        if getter is None: return self
+        try:
+            return each_attribute(getter._container, self.attr, self.attr_getter)
+        except AttributeError as error:
+            failed_attribute_lookup.set((getter, self.attr, error))
+            raise
+
+
+# If set to an int n, `E.each.attr` over n or more members of one type, whose attrs are numbers, eagerly gathers those
+# numbers into an EachArray, so later arithmetic on them can be done by numpy in single C loops
+gather_threshold = None
+gather_sample_size = 8  # How many leading members gathered_attribute checks before committing to gathering
+
+def gathered_attribute(members: Sequence, attr: str) -> Union['EachArray', None]:
+    """Returns an EachArray of each member's attr, or None if members don't look to be suitable for this.  The first
+       gather_sample_size members must all be of one type, with numeric attrs.  The attrs are then fetched by a
+       C-level map of a cached attrgetter and handed to numpy in one go, so no Python code runs per member.
+       (Numba can't read attributes of ordinary Python objects, so compiling this loop wouldn't help.)
+       If some later member's attr turns out not to be numeric, an ordinary EachContainer of the attrs is returned."""
+    if not members: return None
+    sample = members[:gather_sample_size]
+    member_type = type(sample[0])
+    if any(type(m) is not member_type for m in sample): return None
+    getter = attribute_getter(attr)
+    try:
+        if not all(isinstance(getter(m), (int, float, complex)) for m in sample): return None
+    except AttributeError:
+        return None  # let the usual lazy route raise this when the attr is actually used
+    try:
+        values = list(map(getter, members))
+    except AttributeError:
+        return None  # likewise
+    try:
+        whole = numpy.asarray(values)
+    except (ValueError, OverflowError):
+        whole = None
+    if whole is None or whole.ndim != 1 or whole.dtype.kind not in 'biufc':
+        return EachContainer(values, nested=2)
+    return EachArray(whole)
+
+def each_attribute(container: 'EachContainer', attr: str, attr_getter: Callable = None) -> 'EachContainer':
+    """Returns `container.each.attr`, i.e. each member's .attr, nested so that ops will be distributed over these too.
+       Within a `with deferred():` block, members' attrs of sequence-like containers are fetched lazily, as a
+       DeferredEach, like other deferred results.  attr_getter, if given, is `operator.attrgetter(attr)`."""
+    if container._is_each_mapping or hasattr(type(container), attr):
+        return each(getattr(container, attr), nested=2)
+    if gather_threshold is not None and numpy is not None and isinstance(container.whole, (list, tuple)) \
+            and len(container.whole) >= gather_threshold:
+        gathered = gathered_attribute(container.whole, attr)
+        if gathered is not None: return gathered
+    if attr_getter is None: attr_getter = attribute_getter(attr)
+    if deferring.get():
+        return DeferredEach(BroadcastHandler(container), attr_getter, nested=2)
+    whole = container.whole.tolist() if isinstance(container, EachArray) else container.whole  # Python numbers
+    return EachContainer(list(map(attr_getter, whole)), nested=2)
+
+
+def each_nested(tree, order: str = 'dfs', memory_limit: int = 1000) -> Iterable:
+    """Yields each of the leaves of tree, no matter how deeply they are nested within it.
+       Non-string iterables are treated as branches (with mappings and EachContainers contributing their values), and
+       anything else, including strings, is treated as a leaf, yielded as is.
+       `list(each_nested([1, [2, 'ab', {'k': (3,)}]]))` is `[1, 2, 'ab', 3]`.
+       Rather than recursing, this keeps an explicit deque of iterators over pending branches, so trees of any depth
+       can be traversed without hitting Python's recursion limit.  order determines which pending branch is next:
+         'dfs' (the default) goes depth-first, keeping at most one pending iterator per level of depth,
+         'bfs' goes breadth-first, one level at a time, though this may keep a whole level's branches pending, and
+         'hybrid' goes breadth-first until more than memory_limit branches are pending, then depth-first until the
+         number pending is back within that limit."""
+    if order not in ('dfs', 'bfs', 'hybrid'):
+        raise ValueError(f"each_nested order must be 'dfs', 'bfs', or 'hybrid', not {order!r}.")
+    pending = deque((iter((tree,)),))
+    while pending:
+        if order == 'dfs' or order == 'hybrid' and len(pending) > memory_limit:
+            # Depth-first: continue the newest branch until it yields a branch of its own, which then goes next
+            for node in pending[-1]:
+                if is_plural(node):
+                    pending.append(iter(node.values() if is_mapping(node) or isinstance(node, EachContainer) else node))
+                    break
+                yield node
+            else:
+                pending.pop()
+        else:
+            # Breadth-first: finish the oldest branch, queueing the branches within it to go after its siblings
+            for node in pending.popleft():
+                if is_plural(node):
+                    pending.append(iter(node.values() if is_mapping(node) or isinstance(node, EachContainer) else node))
+                else:
+                    yield node
+
+
+def nested_members(members: Iterable, nested: Union[int, bool, None]) -> Iterable:
+    """Returns an iterator over members, as they are to be yielded from an EachContainer with the given nesting.
+       If nested is next or more than 1, each member is wrapped in each(), nested one level less deeply (with next
+       remaining next), leaving scalar members as they are.  Otherwise members are yielded as is."""
+    if nested is next or nested > 1:
+        # A generator calling each directly beats map() over a partial, which must merge its keywords on each call
+        new_nested = next if nested is next else nested - 1
+        return (each(m, nested=new_nested, enlist=False) for m in members)
+    return iter(members)
 
 
 # === EachContainer ===
@@ -486,8 +970,15 @@ class EachContainer(Generic[MemberType]):
         `each(segments).each.wheels = each(each(1,2))`
         `each(segments).each.wheels = each.each(1,2)`  here the bare `each` works as a capsule"""
 
+    # EachContainers are created by every vectorized op, so slots keep them small and their attributes quick to read.
+    # (Since __setattr__ distributes attribute-setting to members, internal attributes are set with object.__setattr__)
+    __slots__ = ('whole', '_each_nested', '__weakref__')
+
     # TODO could consider re-using the more complex output-type selection from Vectors?
     _each_output_type: type        # The type of output ops will produce (will be set once this class is defined)
+    # Whether this is an EachMapping.  isinstance(E, EachMapping) goes through ABCMeta, which is slow to say no,
+    # so indexing and other per-call checks read this class attribute instead
+    _is_each_mapping = False
     whole: Collection[MemberType]  # Will store the members of this EachContainer
 
     # TODO consider what 'for item in each(C)` should yield. One plausible reading is that this just means `for i in C`,
@@ -516,14 +1007,14 @@ class EachContainer(Generic[MemberType]):
     #  each(E
 
     def __init__(self, whole: Iterable[MemberType], nested: Union[int, bool, None] = 1):
-        if not isinstance(whole, Sized): whole = list(whole)
-        self.__dict__['whole'] = whole
-        self.__dict__['_each_nested'] = nested
+        if not has_method(whole, '__len__'): whole = list(whole)
+        object.__setattr__(self, 'whole', whole)
+        object.__setattr__(self, '_each_nested', nested)
 
     def __repr__(self):
         # In the common case of each([1, 2, ...]) we abbreviate to the equivalent each(1, 2, ...)
         if isinstance(self.whole, list):
-            if len(self.whole) != 1 or not isinstance(self.whole[0], Iterable):
+            if len(self.whole) != 1 or not has_method(self.whole[0], '__iter__'):
                 return f"each({repr(self.whole)[1:-1]})"
         # If a list has a 1 iterable member, or if we're each-wrapping a non-list, abbreviation might not be equivalent
         return f"each({repr(self.whole)})"
@@ -543,6 +1034,13 @@ class EachContainer(Generic[MemberType]):
     def __len__(self) -> int:
         return len(self.whole)
 
+    @property
+    def each(self) -> EachAttributeGetter:
+        """`E.each.attr` returns a nested EachContainer, equivalent to `each(each(m.attr) for m in E)`, so that
+           operations upon it will be distributed over each member of each member's attr, e.g. with
+           `each(segments).each.wheels` containing each wheel of each segment."""
+        return EachAttributeGetter(self)
+
     # TODO could have overloaded type signature
     @property
     def themselves(self) -> Iterable[MemberType]:
@@ -553,17 +1051,15 @@ class EachContainer(Generic[MemberType]):
            the contained items in each(), propagating nesting instructions downwards appropriately."""
         # TODO consider whether/how to merge this with .values()
         # TODO consider whether I want this to be more durable and sized than a mere iterable
-        if self._each_nested is next or self._each_nested > 1:
-            new_nested = next if self._each_nested is next else self._each_nested - 1
-            return (each(i, nested = new_nested, enlist=False) for i in self.whole)
-        return iter(self.whole)
+        return nested_members(self.whole, self._each_nested)
 
     @property
     def key(self) -> 'EachContainer[int]':
         """Returns an EachContainer of keys/indices used in this EachContainer.  For sequence-like EachContainers,
            this will be each(range(n)), where n is the length of the container, i.e. the integers 0 ... n-1.
-           This is provided for parity with EachMappings, but can serve many of the same purposes as enumerate()."""
-        return EachContainer(range(len(self.whole)))
+           This is provided for parity with EachMappings, but can serve many of the same purposes as enumerate().
+           Containers of the same length share one such EachContainer, which is safe as its range can't be altered."""
+        return index_container(len(self.whole))
 
     @property
     def keys(self) -> 'Sequence[int]':
@@ -578,18 +1074,29 @@ class EachContainer(Generic[MemberType]):
            for Mappings.  If this container does have nesting instructions, e.g. nested = next, or nested>1,
            then this will wrap the contained items in EachContainers, propagating nesting instructions downwards."""
         # TODO consider whether I want this to be more durable and sized than a mere iterable
-        if self._each_nested is next or self._each_nested > 1:
-            new_nested = next if self._each_nested is next else self._each_nested - 1
-            return (each(i, nested=new_nested, enlist=False) for i in self.whole)
-        return iter(self.whole)
+        return nested_members(self.whole, self._each_nested)
+
+    def as_array(self, dtype = None) -> 'EachArray[MemberType]':
+        """Returns an EachArray containing a numpy ndarray copy of this container's members (or, for an EachMapping,
+           its values, in order, as with .value), optionally of the given dtype.  Numeric ops on an EachArray are done
+           by numpy in single C loops, whereas ops on list-backed EachContainers go member by member.  Converting a
+           list to an array and back costs about as much as doing one op member by member, so each() doesn't do this
+           automatically, but when numeric data will undergo several ops, it pays to convert it once with as_array."""
+        return EachArray(self.values() if self._is_each_mapping else self.whole, dtype=dtype)
 
     def __iter__(self) -> Iterable[MemberType]:
         """`for i in each(C)` yields each item in C. Nested EachContainers are distributed into separate items."""
-        for i in self.values():
-            if isinstance(i, EachContainer):
-                yield from i
-            else:
+        # Nested EachContainers are descended via an explicit stack of iterators, rather than recursive `yield from`,
+        # so deeply nested containers won't hit the recursion limit or pay for a generator frame per level per item.
+        stack = deque((iter(self.values()),))
+        while stack:
+            for i in stack[-1]:
+                if isinstance(i, EachContainer):
+                    stack.append(iter(i.values()))
+                    break
                 yield i
+            else:
+                stack.pop()
 
     def __reversed__(self) -> Iterable[MemberType]:
         return iter(reversed(self.whole))
@@ -609,15 +1116,27 @@ class EachContainer(Generic[MemberType]):
            `each('abc').contains('a', 'x')` returns each(True, False) since 'a' is in 'abc' but 'x' isn't.
            `each([area]).contains(targets)` broadcasts the area TODO ...
            Note that in the second example 'a' is broadcast for use in each comparison, as is 'abc' in the third.
+           `each([['a', 'b'], ['c']], nested=2).contains('a')` returns each(each(True, False), each(False)).
            `E1.contains(E2)` and `E2.is_in(E1)` are equivalent, and will be used to handle nested eachContainers."""
         # If given a single target iterable, unpack it so BroadcastHandler won't see it as encapsulated
-        if len(items)==1 and isinstance(items[0],Iterable) and not isinstance(items[0], str):
+        if len(items)==1 and is_plural(items[0]):
             items = items[0]
+        whole = self.whole
+        # With a flat sequence of members, and no nested EachContainers to defer to, we can skip BroadcastHandler
+        if self._each_nested == 1 and type(whole) in (list, tuple) and type(items) in (list, tuple) and \
+                (len(items) == len(whole) or len(items) == 1) and not has_each_members(whole) \
+                and not has_each_members(items):
+            if len(items) == len(whole):
+                return self._each_output_type(list(map(operator.contains, whole, items)), nested=1)
+            item = items[0]
+            return self._each_output_type([item in s for s in whole], nested=1)
         B = BroadcastHandler(self, items)
-        return B(s.contains(i) if isinstance(s, EachContainer) else
-                 i.is_in(s)    if isinstance(i, EachContainer) else
-                 i in s
-                 for s, i in B)
+        if not may_yield_each_members(self) and not may_yield_each_members(B.sources[1]):
+            return B([i in s for s, i in B])  # no nested EachContainers, so no need to check for them per member
+        return B([s.contains(i) if isinstance(s, EachContainer) else
+                  i.is_in(s)    if isinstance(i, EachContainer) else
+                  i in s
+                  for s, i in B])
 
     def is_in(self, *containers) -> 'EachContainer[bool]':
         """A distributable way of testing whether each member of this container is a member of another container or
@@ -629,13 +1148,24 @@ class EachContainer(Generic[MemberType]):
            `each('a').is_in('abc','xyz') returns each(True, False) since 'a' is in 'abc' but not in 'xyz'.
            Note that in the second example, 'abc' is broadcast for use in each comparison, as is 'a' in the third.
            `E1.contains(E2)` and `E2.is_in(E1)` are equivalent, and will be used to handle nested EachContainers."""
-        if len(containers)==1 and isinstance(containers[0],Iterable) and not isinstance(containers[0], str):
+        if len(containers)==1 and is_plural(containers[0]):
             containers = containers[0]
+        whole = self.whole
+        # With a flat sequence of members, and no nested EachContainers to defer to, we can skip BroadcastHandler
+        if self._each_nested == 1 and type(whole) in (list, tuple) and type(containers) in (list, tuple) and \
+                (len(containers) == len(whole) or len(containers) == 1) and not has_each_members(whole) \
+                and not has_each_members(containers):
+            if len(containers) == len(whole):
+                return self._each_output_type(list(map(operator.contains, containers, whole)), nested=1)
+            container = containers[0]
+            return self._each_output_type([s in container for s in whole], nested=1)
         B = BroadcastHandler(self, containers)
-        return B(s.is_in(c)    if isinstance(s, EachContainer) else
-                 c.contains(s) if isinstance(c, EachContainer) else
-                 s in c
-                 for s, c in B)
+        if not may_yield_each_members(self) and not may_yield_each_members(B.sources[1]):
+            return B([s in c for s, c in B])  # no nested EachContainers, so no need to check for them per member
+        return B([s.is_in(c)    if isinstance(s, EachContainer) else
+                  c.contains(s) if isinstance(c, EachContainer) else
+                  s in c
+                  for s, c in B])
 
     # E[...] can return various types depending on what indices are given, so type-hinting requires @overload
     @overload  # E[index] returns a single member
@@ -656,7 +1186,8 @@ class EachContainer(Generic[MemberType]):
            `E[start:stop:step]` or other slices like `E[:stop]` or `E[start:]` return each item in E satisfying the
              slice. If E.whole does not support slicing, this will be approximated, returning a subcontainer whose
              indices in E satisfied start <= i < stop, though for mappings step will be ignored, and for other
-             iterables negative start and stop will be converted to positive, and negative step will raise an error.
+             iterables negative start and stop will be converted to positive, and negative step will raise an error
+             unless E.whole can be indexed by position.
              If E is a mapping, this returns a submapping with the same keys. Otherwise it returns a subsequence
              with its indices automatically renumbered (since sequence indices always start at 0 and count up).
            `each[D]['a':'n']` therefore returns the subdict of dict D whose keys start with 'a' through 'm'.
@@ -687,54 +1218,60 @@ class EachContainer(Generic[MemberType]):
         domain: Union[MemberType, Iterable[MemberType], Mapping[KeyType, MemberType]]
 
         # -- Calculate the domain of relevant member(s) within this EachContainer --
-        if domain_index == slice(None, None, None):  # Processing E[:], full slice, so no need to index/slice E
+        # Processing E[:], full slice, so no need to index/slice E.  (Checking the slice's fields avoids a slice.__eq__
+        # call, and an == that a plural domain_index like an EachContainer mask would distribute.)
+        if type(domain_index) is slice and domain_index.start is None and domain_index.stop is None \
+                and domain_index.step is None:
             if not range_indices: return self        # E[:] just is E itself
             domain = self.whole                      # E[:, range] uses E.whole as domain, indexes into each member
             output_type = self._each_output_type
-        elif isinstance(domain_index, slice):        # When the domain is a partial slice...
+        elif type(domain_index) is slice:            # When the domain is a partial slice...
             try:                                     # First we see if self.whole knows how to handle slices
                 domain = self.whole[domain_index]
             except:                                  # But if it doesn't, we then must approximate this ourselves.
                 start, stop, step = domain_index.start, domain_index.stop, domain_index.step
-                if isinstance(self, EachMapping):
+                if self._is_each_mapping:
                     domain = {key:value for key, value in self.items()
                                         if (start is None or start <= key) and (stop is None or key < stop)}
                     output_type = type(self)  # EachMapping or EachSet
                 # # TODO This seems intuitively right for sets, but haven't yet committed to a way of handling these
                 # elif isinstance(self.whole, set):
                 #     domain = {m for m in self.whole if (start is None or start <= m) and (stop is None or m < stop)}
-                else:
-                    if start < 0: start += len(self.whole)
-                    if stop  < 0: start += len(self.whole)
-                    domain = itertools.islice(self.whole, start, stop, step)
-        elif isinstance(domain_index, Mapping):  # Processing E[mapping]
+                else:  # slice.indices resolves None and negative bounds in one C call
+                    start, stop, step = domain_index.indices(len(self.whole))
+                    if hasattr(type(self.whole), '__getitem__'):  # e.g. a deque, which can be indexed but not sliced
+                        domain = map(self.whole.__getitem__, range(start, stop, step))
+                    else:
+                        domain = itertools.islice(self.whole, start, stop, step)
+        elif is_mapping(domain_index):  # Processing E[mapping]
             # A boolean mask like E[E>1] would map keys/indices to True/False values
-            if all(x is True or x is False for x in domain_index.values()):
-                if isinstance(self, Mapping):  # A boolean mask on a mapping returns a submapping
-                    domain = {key:value for key,value in self.items() if domain_index[key] is True}
+            if is_boolean_mask(domain_index.values()):
+                if self._is_each_mapping:  # A boolean mask on a mapping returns a submapping
+                    keys = self.keys()  # (EachSet and EachMapping keys and values are aligned, so can be zipped)
+                    domain = dict(itertools.compress(zip(keys, self.values()), map(domain_index.__getitem__, keys)))
                     output_type = type(self)  # EachMapping or EachSet
-                else:                                # A boolean mask on a sequence returns a subsequence
-                    domain = (value for index, value in enumerate(self.whole) if domain_index[index] is True)
+                else:                                    # A boolean mask on a sequence returns a subsequence
+                    domain = itertools.compress(self.whole, map(domain_index.__getitem__, range(len(self.whole))))
             else: # Processing E[mapping] where the mapping maps new_indices to old_indices
                 # if self.whole doesn't support getitem (e.g., because it is a set or dictview), spiel it into a tuple
                 whole = self.whole if hasattr(type(self.whole), '__getitem__') else tuple(self.whole)
                 domain = {new_index: whole[old_index] for new_index, old_index in domain_index.items()}
-        elif isinstance(domain_index, Iterable) and not isinstance(domain_index, str):  # Processing E[iterable]
-            try:  # Check if the given domain_index has introspectable length
-                length = len(domain_index)
-            except TypeError:  # If it doesn't (e.g. due to being a raw generator) we'll spiel it into a tuple
+        elif is_plural(domain_index):  # Processing E[iterable]
+            if source_kind(domain_index) == 'iterable':  # If it has no length (e.g. a generator), spiel it into a tuple
                 domain_index = tuple(domain_index)
             # A boolean mask like E[E>1] would be a length-matched sequence of True/False values
-            if len(domain_index) == len(self.whole) and all(x is True or x is False for x in domain_index):
-                if isinstance(self.whole, Mapping):
+            if len(domain_index) == len(self.whole) and is_boolean_mask(domain_index):
+                if is_mapping(self.whole):
                     whole = self.whole
-                    domain = {index: whole[index] for index, boolean in enumerate(domain_index) if boolean is True}
+                    domain = {index: whole[index] for index in itertools.compress(itertools.count(), domain_index)}
                     output_type = EachMapping
                 else:
-                    domain = (value for value, boolean in zip(self.whole, domain_index) if boolean is True)
-            else:  # Any other sequence is taken to be a sequence of separate indices to look up
+                    domain = itertools.compress(self.whole, domain_index)  # filters in C, as the mask is all True/False
+            elif len(domain_index) >= 2:  # Any other sequence is taken to be a sequence of separate indices to look up
+                domain = list(operator.itemgetter(*domain_index)(self.whole))  # gathers them all in one C call
+            else:  # (whereas an itemgetter of a lone index would return that member bare, rather than in a tuple)
                 whole = self.whole
-                domain = (whole[x] for x in domain_index)
+                domain = [whole[x] for x in domain_index]
         else:  # otherwise, we were given a non-slice non-iterable domain_index
             domain = self.whole[domain_index]
             domain_is_singular = True
@@ -747,10 +1284,11 @@ class EachContainer(Generic[MemberType]):
         if len(range_indices) == 1: range_indices = range_indices[0]  # Treat 1-tuple as a single naked range index
         if domain_is_singular:  # If E[d] is a single member of E, E[d, range] returns its submember
             return domain[range_indices]
-        if isinstance(domain, Mapping):  # If E[d] maps keys to members, E[d, range] maps keys to submembers
-            return EachMapping({key: member[range_indices] for key, member in domain.items()})
+        get_submember = operator.itemgetter(range_indices)
+        if is_mapping(domain):  # If E[d] maps keys to members, E[d, range] maps keys to submembers
+            return EachMapping(dict(zip(domain.keys(), map(get_submember, domain.values()))))
         # Otherwise, E[d] is series of members, so E[d, range] is a series of submembers
-        return output_type(member[range_indices] for member in domain)
+        return output_type(map(get_submember, domain))
 
 
     # E[...] = new_value should take different types depending on what indices are given, so we need @overload
@@ -801,44 +1339,57 @@ class EachContainer(Generic[MemberType]):
         if isinstance(item, tuple):  # E[domain, range] = new_value
             domain_index = item[0]                               # peel off the first index to slice the each-container itself
             range_index = item[1] if len(item)==2 else item[1:]  # remaining indices will slice each member
-            for member, value in zip(self[domain_index], repeat_if_singular(new_value)):
+            members = self[domain_index]
+            if not isinstance(members, EachContainer):  # E[index, range] = v sets m[range] = v for the one member m
+                members[range_index] = new_value
+                return
+            # Unless members must be distributed into nested EachContainers, iterate them plainly, bypassing __iter__
+            if not may_yield_each_members(members): members = members.values()
+            for member, value in zip(members, repeat_if_singular(new_value)):
                 member[range_index] = value
             return
 
         # Otherwise we're dealing with the somewhat tricker case of E[domain] = v, where we need to tell E.whole to
         # modify itself, so it isn't enough to just get E[domain]. Instead we need to compute *indices* for E[domain].
         domain: Iterable[Union[int, KeyType]]  # will yield the keys/indices whose values in E should be replaced
-        if isinstance(item, Mapping):  # Processing E[mapping] = v
+        if is_mapping(item):  # Processing E[mapping] = v
             # A boolean mask mapping like E[E>1] would map keys/indices to True/False values
-            if all(x is True or x is False for x in item.values()):
-                domain = (key for key, boolean in item.items() if boolean is True)
+            if is_boolean_mask(item.values()):
+                domain = itertools.compress(item.keys(), item.values())
             else:  # Processing E[mapping] where mapping.values() specify the keys/indices to replace
                 domain = item.values()
-        elif isinstance(item, Iterable) and not isinstance(item, str):  # Processing E[iterable] = v
-            try:  # Check if the given item has introspectable length
-                length = len(item)
-            except TypeError:  # If it doesn't (e.g. due to being a raw generator) we'll spiel it into a tuple
+        elif is_plural(item):  # Processing E[iterable] = v
+            if source_kind(item) == 'iterable':  # If it has no length (e.g. a generator), spiel it into a tuple
                 item = tuple(item)
             # A boolean mask sequence like E[E>1] would be a length-matched sequence of True/False values
-            if len(item) == len(self.whole) and all(x is True or x is False for x in item):
-                domain = (i for i, boolean in enumerate(item) if boolean is True)
+            if len(item) == len(self.whole) and is_boolean_mask(item):
+                domain = itertools.compress(itertools.count(), item)
             else:  # Any other sequence is taken to be a sequence of separate indices to modify
                 domain = item
-        elif isinstance(item, slice) and isinstance(self, Mapping):  # processing each(mapping)[slice] = v
-            if item == slice(None, None, None):  # each(mapping)[:] = v replaces values for all keys
+        elif type(item) is slice and self._is_each_mapping:  # processing each(mapping)[slice] = v
+            if item.start is None and item.stop is None and item.step is None:  # each(mapping)[:] = v sets all
                 domain = self.whole.keys()
             else:
                 # TODO in theory, some Mappings could themselves support setitem with slice keys. Should try first?
                 start, stop, step = item.start, item.stop, item.step
-                domain = {key for key in self.whole.keys()
-                              if (start is None or start <= key) and (stop is None or key < stop)}
-        elif isinstance(item, slice) and (isinstance(new_value, str) or not isinstance(new_value, Iterable)):
+                # A list, not a set, so keys will be matched with new values in order of key creation, as documented
+                domain = [key for key in self.whole.keys()
+                              if (start is None or start <= key) and (stop is None or key < stop)]
+        elif type(item) is slice and not is_plural(new_value):
             # processing each(sequence)[slice] = scalar; we need to compute indices of slice to stick scalar into
-            domain = range(item.indices(len(self.whole)))
+            domain = range(*item.indices(len(self.whole)))
+            if type(self.whole) is list:  # a list can take all the copies of scalar in one C-level slice assignment
+                self.whole[item] = [new_value] * len(domain)
+                return
         else:  # otherwise, item is a scalar or a sequence-slice with an iterable new_value to splice into it
             self.whole[item] = new_value
             return
         # If we reach this point, domain is now an iterable of indices that we need to modify.
+        if not is_plural(new_value):  # a singular new_value needn't be repeated and zipped with each index
+            whole = self.whole
+            for index in domain:
+                whole[index] = new_value
+            return
         for index, value in zip(domain, repeat_if_singular(new_value)):
             self.whole[index] = value
 
@@ -850,9 +1401,15 @@ class EachContainer(Generic[MemberType]):
 
     def __getattr__(self, attr):  # motors.velocity returns each of m.velocity for all motors
         """E.attr returns each member's .attr, i.e. each(m.attr for m in E)."""
-        return self._each_output_type(getattr(m, attr) for m in self.whole)
+        return self._each_output_type(list(map(attribute_getter(attr), self.whole)))
 
     def __setattr__(self, attr, value):  # E.attr = value sets each m.attr, broadcasting value if needed
+        whole = self.whole
+        # Setting a scalar on each member of a plain list needs none of the broadcasting machinery below
+        if not is_plural(value) and self._each_nested == 1 and type(whole) in (list, tuple) and len(whole) != 1:
+            for m in whole:
+                setattr(m, attr, value)
+            return
         # with_matched_version of will broadcast other, but will not broadcast a length-1 self
         for m,v in with_matched_version_of(self, value):
             setattr(m, attr, v)
@@ -861,10 +1418,31 @@ class EachContainer(Generic[MemberType]):
         # Note that E.method will create an EachContainer of bound methods, and then *its* __call__ will call them
         # We run together self, the args, and the values of kwargs for broadcasting, then disentangle after
         # TODO think about whether a class should be able to have an EachFunction as a method, and how to bind to instances
+        # Calls like E.method() or E.method(scalar) need no broadcasting, so plain lists of callables skip BroadcastHandler
+        if not kwargs and len(args) <= 1 and self._each_nested == 1 and type(self.whole) in (list, tuple):
+            whole = self.whole
+            if len(whole) != 1 and (parallel_threshold is None or len(whole) < parallel_threshold):
+                if not args:
+                    return self._each_output_type([f() for f in whole], nested=1)
+                arg = args[0]
+                if not is_plural(arg):
+                    return self._each_output_type([f(arg) for f in whole], nested=1)
         B = BroadcastHandler(self, *args, *(kwargs.values()))
+        if args and not kwargs and len(self.whole) == 1 and B.is_range:
+            fn = next(iter(self.whole))
+            arrays = ndarray_operands(B.sources[1:], B.n, convert=True) if is_vectorized(fn) else None
+            if arrays is not None:  # each(ufunc)(numbers) can call ufunc just once on a whole array
+                result = array_result(fn, *arrays)
+                if isinstance(result, numpy.ndarray) and result.shape == (B.n,):
+                    return EachArray(result)
         start_k = 1 + len(args)  # fn takes 1, args take len(args), kwargs take the rest
-        return B(f_a_k[0](*f_a_k[1:start_k], **{key: value for key, value in zip(kwargs.keys(), f_a_k[start_k:])})
-                 for f_a_k in B)
+        keys = tuple(kwargs.keys())  # frozen once, so each call's kwargs dict is built by one C-level dict(zip(...))
+        if parallel_threshold is not None and B.n >= parallel_threshold:
+            return B(parallel_map(lambda f_a_k: f_a_k[0](*f_a_k[1:start_k], **dict(zip(keys, f_a_k[start_k:]))),
+                                  list(B)))
+        if not keys:
+            return B([f_a[0](*f_a[1:]) for f_a in B])
+        return B([f_a_k[0](*f_a_k[1:start_k], **dict(zip(keys, f_a_k[start_k:]))) for f_a_k in B])
 
     # TODO generalize return types and type-hints to allow subclasses like Pair to retain their (sub)class
 
@@ -873,196 +1451,334 @@ class EachContainer(Generic[MemberType]):
 
     # TODO technically should overload to show that dict+dict -> dict, whereas each+any->each
     def __add__(self, other)->'EachContainer[MemberType]':   # self + other
-        B = BroadcastHandler(self, other)
-        return B(s + o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.add)
 
     # TODO generalize other ops to match __add__ so will return mappings for mappings
 
     def __radd__(self, other)->'EachContainer[MemberType]':  # other + self
-        B = BroadcastHandler(self, other)
-        return B(o + s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.add, reflected=True)
     def __iadd__(self,other) -> 'EachContainer[MemberType]':  # self += other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s + o for s, o in B)
-        # self.__dict__['whole'] = [s + o for s, o in with_matched_version_of(self, other)]
-        # return self
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.add)
 
     def __sub__(self, other)->'EachContainer[MemberType]':    # self - other
-        B = BroadcastHandler(self, other)
-        return B(s - o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.sub)
     def __rsub__(self, other)->'EachContainer[MemberType]':   # other - self
-        B = BroadcastHandler(self, other)
-        return B(o - s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.sub, reflected=True)
     def __isub__(self,other) -> 'EachContainer[MemberType]':  # self -= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s - o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.sub)
 
     def __mul__(self, other)->'EachContainer[MemberType]':    # self * other
-        B = BroadcastHandler(self, other)
-        return B(s * o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.mul)
     def __rmul__(self, other)->'EachContainer[MemberType]':   # other * self
-        B = BroadcastHandler(self, other)
-        return B(o * s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.mul, reflected=True)
     def __imul__(self,other) -> 'EachContainer[MemberType]':  # self *= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s * o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.mul)
 
     def __pow__(self, other)->'EachContainer[MemberType]':    # self ** other
-        B = BroadcastHandler(self, other)
-        return B(s ** o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.pow)
     def __rpow__(self, other)->'EachContainer[MemberType]':   # other ** self
-        B = BroadcastHandler(self, other)
-        return B(o ** s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.pow, reflected=True)
     def __ipow__(self,other) -> 'EachContainer[MemberType]':  # self **= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s ** o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.pow)
 
     def __mod__(self, other)->'EachContainer[MemberType]':    # self % other
-        B = BroadcastHandler(self, other)
-        return B(s % o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.mod)
     def __rmod__(self, other)->'EachContainer[MemberType]':   # other % self
-        B = BroadcastHandler(self, other)
-        return B(o % s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.mod, reflected=True)
     def __imod__(self,other) -> 'EachContainer[MemberType]':  # self %= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s % o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.mod)
 
     def __truediv__(self, other)->'EachContainer[MemberType]':    # self / other
-        B = BroadcastHandler(self, other)
-        return B(s / o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.truediv)
     def __rtruediv__(self, other)->'EachContainer[MemberType]':   # other / self
-        B = BroadcastHandler(self, other)
-        return B(o / s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.truediv, reflected=True)
     def __itruediv__(self,other) -> 'EachContainer[MemberType]':  # self /= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s / o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.truediv)
 
     def __floordiv__(self, other)->'EachContainer[MemberType]':   # self // other
-        B = BroadcastHandler(self, other)
-        return B(s // o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.floordiv)
     def __rfloordiv__(self, other)->'EachContainer[MemberType]':  # other // self
-        B = BroadcastHandler(self, other)
-        return B(o // s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.floordiv, reflected=True)
     def __ifloordiv__(self,other) -> 'EachContainer[MemberType]':  # self //= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s // o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.floordiv)
 
     def __matmul__(self, other)->'EachContainer[MemberType]':    # self @ other
-        B = BroadcastHandler(self, other)
-        return B(s @ o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.matmul)
     def __rmatmul__(self, other)->'EachContainer[MemberType]':   # other @ self
-        B = BroadcastHandler(self, other)
-        return B(o @ s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.matmul, reflected=True)
     def __imatmul__(self,other) -> 'EachContainer[MemberType]':  # self @= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s @ o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.matmul)
 
     # --- each-container vectorized bitwise ops ---
     def __and__(self, other)->'EachContainer[MemberType]':   # self & other
-        B = BroadcastHandler(self, other)
-        return B(s & o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.and_)
     def __rand__(self, other)->'EachContainer[MemberType]':  # other & self
-        B = BroadcastHandler(self, other)
-        return B(o & s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.and_, reflected=True)
     def __iand__(self,other) -> 'EachContainer[MemberType]':  # self &= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s & o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.and_)
 
     def __or__(self, other)->'EachContainer[MemberType]':    # self | other
-        B = BroadcastHandler(self, other)
-        return B(s | o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.or_)
     def __ror__(self, other)->'EachContainer[MemberType]':   # other | self
-        B = BroadcastHandler(self, other)
-        return B(o | s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.or_, reflected=True)
     def __ior__(self,other) -> 'EachContainer[MemberType]':  # self |= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s | o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.or_)
 
     def __xor__(self, other)->'EachContainer[MemberType]':    # self ^ other
-        B = BroadcastHandler(self, other)
-        return B(s ^ o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.xor)
     def __rxor__(self, other)->'EachContainer[MemberType]':   # other ^ self
-        B = BroadcastHandler(self, other)
-        return B(o ^ s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.xor, reflected=True)
     def __ixor__(self,other) -> 'EachContainer[MemberType]':  # self ^= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s ^ o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.xor)
 
     def __lshift__(self, other)->'EachContainer[MemberType]':    # self << other
-        B = BroadcastHandler(self, other)
-        return B(s << o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.lshift)
     def __rlshift__(self, other)->'EachContainer[MemberType]':   # other << self
-        B = BroadcastHandler(self, other)
-        return B(o << s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.lshift, reflected=True)
     def __ilshift__(self,other) -> 'EachContainer[MemberType]':  # self <<= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s << o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.lshift)
 
     def __rshift__(self, other)->'EachContainer[MemberType]':    # self >> other
-        B = BroadcastHandler(self, other)
-        return B(s >> o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.rshift)
     def __rrshift__(self, other)->'EachContainer[MemberType]':   # other >> self
-        B = BroadcastHandler(self, other)
-        return B(o >> s for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.rshift, reflected=True)
     def __irshift__(self,other) -> 'EachContainer[MemberType]':  # self >>= other
-        B = BroadcastHandler(self, other, match_first=True)
-        return B.in_place(s >> o for s, o in B)
+        return BroadcastHandler(self, other, match_first=True).apply_in_place(operator.rshift)
 
     # --- each-container vectorized unary ops ---
 
     def __neg__(self)->'EachContainer[MemberType]':    # -self
-        B = BroadcastHandler(self)
-        return B(-s for (s,) in B)
+        return apply_unary(self, operator.neg)
 
     def __pos__(self)->'EachContainer[MemberType]':    # +self
-        B = BroadcastHandler(self)
-        return B(+s for (s,) in B)
+        return apply_unary(self, operator.pos)
 
     def __abs__(self)->'EachContainer[MemberType]':    # abs(self)
-        B = BroadcastHandler(self)
-        return B(abs(s) for (s,) in B)
+        return apply_unary(self, abs)
 
     def __invert__(self)->'EachContainer[MemberType]':    # ~self
-        B = BroadcastHandler(self)
-        return B(~s for (s,) in B)
+        return apply_unary(self, operator.invert)
 
     def __round__(self, n=None) ->'EachContainer[MemberType]':  # round(self, n)
-        B = BroadcastHandler(self)
-        return B(round(s, n) for (s,) in B)
+        return apply_unary(self, partial(round, ndigits=n))
 
     def __trunc__(self) ->'EachContainer[MemberType]':  # math.trunc(self)
-        B = BroadcastHandler(self)
-        return B(trunc(s) for (s,) in B)
+        return apply_unary(self, trunc, array_op=numpy and partial(rounded_to_ints, array_op=numpy.trunc))
 
     def __floor__(self) ->'EachContainer[MemberType]':  # math.floor(self)
-        B = BroadcastHandler(self)
-        return B(floor(s) for (s,) in B)
+        return apply_unary(self, floor, array_op=numpy and partial(rounded_to_ints, array_op=numpy.floor))
 
     def __ceil__(self) ->'EachContainer[MemberType]':  # math.ceil(self)
-        B = BroadcastHandler(self)
-        return B(ceil(s) for (s,) in B)
+        return apply_unary(self, ceil, array_op=numpy and partial(rounded_to_ints, array_op=numpy.ceil))
 
     # --- each-container comparison operations ---
+    # These go through apply, like arithmetic, so comparisons involving ndarrays yield boolean EachArray masks at once
 
     def __gt__(self, other):
-        B = BroadcastHandler(self, other)
-        return B(s > o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.gt)
 
     def __ge__(self, other):
-        B = BroadcastHandler(self, other)
-        return B(s >= o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.ge)
 
     def __lt__(self, other):
-        B = BroadcastHandler(self, other)
-        return B(s < o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.lt)
 
     def __le__(self, other):
-        B = BroadcastHandler(self, other)
-        return B(s <= o for s, o in B)
+        return BroadcastHandler(self, other).apply(operator.le)
 
 EachContainer._each_output_type = EachContainer
 
 
+# === Array-backed containers ===
+
+class EachArray(EachContainer[MemberType]):
+    """`EachArray(members, dtype=None)` is an EachContainer whose whole is always a 1-dimensional numpy ndarray, for
+       when you know your members are numbers and want numpy speed.  `each(..., dtype=float)` returns an EachArray.
+       Arithmetic and rounding ops between EachArrays and numeric operands are done by numpy in a single C loop,
+       yielding further EachArrays, as are calls like `each(numpy.sqrt)(A)` of ufuncs or each_jit functions.
+       Ops that numpy can't vectorize fall back to member-by-member evaluation, yielding ordinary EachContainers,
+       as do ops where some member would raise an error or flag a floating-point problem, like `A // 0`, `A ** -1`
+       on ints, or `A + 2**70`, so these give Python's own errors and results.  The exception is integer overflow
+       within int64, which numpy wraps silently, so `each([2**62], dtype=int) * 4` gives each(0), not each(2**64).
+       Iterating an EachArray yields Python numbers, as ndarray.tolist() would, rather than numpy scalars, and so
+       do indexing like `A[0]` and `A[[0, 1]]`, and distributed attributes and methods like `A.bit_length()`."""
+
+    __slots__ = ()
+
+    def __init__(self, whole: Iterable[MemberType], nested: Union[int, bool, None] = 1, dtype = None):
+        if numpy is None: raise ImportError("EachArray requires numpy, which could not be imported.")
+        if isinstance(whole, EachContainer): whole = whole.whole
+        if not isinstance(whole, numpy.ndarray):
+            whole = numpy.fromiter(whole, dtype=dtype) if dtype is not None else numpy.asarray(list(whole))
+        elif dtype is not None:
+            whole = whole.astype(dtype, copy=False)
+        if whole.ndim != 1: raise ValueError(f"EachArray needs 1-dimensional data, not shape {whole.shape}.")
+        super().__init__(whole, nested=nested)
+
+    def values(self) -> Iterable[MemberType]:
+        return iter(self.whole.tolist())
+
+    def __iter__(self) -> Iterable[MemberType]:
+        return iter(self.whole.tolist())
+
+    def __getitem__(self, item):
+        result = super().__getitem__(item)
+        if isinstance(result, numpy.generic):  # A lone member is given as a Python number, as iterating would yield
+            return result.item()
+        if result is self or not isinstance(result, EachContainer):
+            return result
+        if is_mapping(result.whole):  # e.g. from A[{new_index: old_index}]
+            whole = result.whole
+            for key, value in whole.items():
+                if isinstance(value, numpy.generic): whole[key] = value.item()
+            return result
+        # Subsequences stay numpy-backed, and so likewise iterate as Python numbers
+        return EachArray(result.whole if isinstance(result.whole, numpy.ndarray) else list(result),
+                         nested=result._each_nested)
+
+    def __getattr__(self, attr):  # Members' attrs are those of the Python numbers that iterating this yields
+        return self._each_output_type(list(map(attribute_getter(attr), self.whole.tolist())))
+
+EachArray._each_output_type = EachContainer  # Member-by-member fallbacks may produce non-numeric members
+
+
+# === Deferred evaluation ===
+
+# How many `with deferred():` blocks are currently open in this thread (or asyncio task).  A ContextVar, rather than a
+# plain global, keeps one thread's deferred() block from making other threads' ops lazy
+deferring = ContextVar('deferring', default=0)
+
+@contextmanager
+def deferred():
+    """Within a `with deferred():` block, vectorized ops on sequence-like EachContainers return DeferredEach results
+       that postpone computing their values.  When a chain of ops like `E1 * E2 + E3` is eventually used, its values
+       are computed in a single fused pass, with each value streaming through every op in the chain, rather than
+       filling a whole intermediate container for `E1 * E2` before adding `E3`.  Note that deferred results reflect
+       the state of their operands when they are computed, so operands shouldn't be altered before results are used,
+       and using a result whose operands have since changed length raises ValueError.  Deferral applies only to ops
+       in the thread (or asyncio task) that opened the block."""
+    token = deferring.set(deferring.get() + 1)
+    try:
+        yield
+    finally:
+        deferring.reset(token)
+
+
+class DeferredEach(EachContainer[OutputType]):
+    """A DeferredEach stands in for the result of a vectorized op performed within a `with deferred():` block.
+       Its length is known immediately, but its .whole is computed only when first needed.  When a DeferredEach
+       is itself an operand of a deferred op, its values are streamed into that op rather than being stored."""
+
+    __slots__ = ('_deferred_op',)  # (B, op, reflected) until .whole is computed, then None
+
+    def __init__(self, B: BroadcastHandler, op: Callable[..., OutputType], reflected: bool = False, nested: int = 1):
+        object.__setattr__(self, '_deferred_op', (B, op, reflected))
+        object.__setattr__(self, '_each_nested', nested)
+
+    @property
+    def is_pending(self) -> bool:
+        """True if this DeferredEach's .whole has not yet been computed."""
+        return self._deferred_op is not None
+
+    def __len__(self) -> int:
+        return self._deferred_op[0].n if self._deferred_op is not None else len(self.whole)
+
+    def stream(self) -> Iterable[OutputType]:
+        """Returns an iterator that computes each of this DeferredEach's values in turn.  Raises ValueError if any
+           operand has changed length since the op was deferred, as the broadcast layout would no longer fit it."""
+        B, op, reflected = self._deferred_op
+        for source, length in zip(B.sources, B.lengths):
+            if len(source) != length:
+                raise ValueError(f"A deferred operand's length changed from {length} to {len(source)} before its "
+                                 f"result was computed.")
+        columns = B.columns()
+        return map(op, *columns[::-1]) if reflected else map(op, *columns)
+
+    def values(self) -> Iterable[OutputType]:
+        if self._deferred_op is None: return super().values()
+        # Until .whole is needed, values are streamed, so consumers that stop early needn't compute the rest
+        return nested_members(self.stream(), self._each_nested)
+
+    def __getattr__(self, attr):
+        if attr == 'whole':  # .whole is computed and stored upon first use
+            B = self._deferred_op[0]
+            whole = B(self.stream()).whole
+            object.__setattr__(self, 'whole', whole)
+            object.__setattr__(self, '_deferred_op', None)
+            return whole
+        return super().__getattr__(attr)
+
+
+class EachIterable(EachContainer[MemberType]):
+    """`each(iterator, enlist=False)` returns an EachIterable, which wraps an unsized iterable, like a generator,
+       without first spieling it into a list.  Iterating an EachIterable (e.g. in a for loop or sum(), though not in
+       list(), which asks for its len first) streams members straight from the iterable, so a single pass over a huge
+       generator needn't hold all of its members at once.  Anything else that needs the members, like len(),
+       indexing or vectorized ops, spiels the iterable into a list that becomes .whole.
+       Since the iterable can be consumed only once, members already streamed by iteration won't be in that .whole,
+       so an EachIterable should either be iterated just once, or be used only in ways that spiel it first."""
+
+    __slots__ = ('_source',)  # the wrapped iterator, until .whole is spieled from it, then None
+
+    def __init__(self, source: Iterable[MemberType], nested: Union[int, bool, None] = 1):
+        object.__setattr__(self, '_source', iter(source))
+        object.__setattr__(self, '_each_nested', nested)
+
+    @property
+    def is_pending(self) -> bool:
+        """True if this EachIterable's source has not yet been spieled into its .whole."""
+        return self._source is not None
+
+    def values(self) -> Iterable[MemberType]:
+        if self._source is None: return super().values()
+        return nested_members(self._source, self._each_nested)
+
+    def __getattr__(self, attr):
+        if attr == 'whole':  # .whole is spieled from the source upon first use
+            whole = list(self._source)
+            object.__setattr__(self, 'whole', whole)
+            object.__setattr__(self, '_source', None)
+            return whole
+        return super().__getattr__(attr)
+
+
+class PositionalView(Sequence[MemberType]):
+    """A read-only sequence view of a collection that has no positional indexing of its own, like a dictionary's
+       values view or a set, as wrapped by `each(D).value`.  It iterates and sizes as the collection does, so it
+       reflects later changes to the collection.  `view[i]` and `view[slice]` find values by their position in
+       iteration order by walking the collection, so, unlike list indexing, each such lookup takes time proportional
+       to the position."""
+
+    __slots__ = ('collection',)
+
+    def __init__(self, collection: Collection[MemberType]):
+        self.collection = collection
+
+    def __len__(self) -> int:
+        return len(self.collection)
+
+    def __iter__(self) -> Iterable[MemberType]:
+        return iter(self.collection)
+
+    def __reversed__(self) -> Iterable[MemberType]:
+        return reversed(list(self.collection))
+
+    def __contains__(self, value) -> bool:
+        return value in self.collection
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return list(self.collection)[index]
+        index = operator.index(index)
+        n = len(self.collection)
+        if index < 0: index += n
+        if not 0 <= index < n: raise IndexError(f"{type(self).__name__} index out of range")
+        return next(itertools.islice(self.collection, index, None))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.collection!r})"
+
+
 class EachMapping(EachContainer[MemberType], MutableMapping[KeyType, MemberType]):
     """If D is a dictionary (or other MutableMapping), then each(D) will be an "each"-wrapped version of D that
        behaves much like D, but lends itself easily to distributed and vectorized operations involving D's values.
@@ -1082,6 +1798,9 @@ class EachMapping(EachContainer[MemberType], MutableMapping[KeyType, MemberType]
        computes a union of whole dictionaries. This is analogous to `each(L1)+L2` adding each member, and `L1+L2`
        concatenating whole lists.  The whole corresponding to EachContainer E is `E.whole`.
        """
+    __slots__ = ()  # subclasses need their own __slots__, else instances regain a __dict__
+    _is_each_mapping = True
+
     # TODO It might also make sense to have other ops on dicts like each(math.sqrt)(D) make dicts with the same keys too
 
     # TODO consider whether `__contains__` and `__iter__` should involve *keys* as in traditional Python, or *values*
@@ -1189,10 +1908,22 @@ class EachMapping(EachContainer[MemberType], MutableMapping[KeyType, MemberType]
         """If D is a dictionary, each(D).values() will be an EachContainer of each value in D, in order of key creation."""
         return self.whole.values()
 
+    @property
+    def value(self) -> EachContainer[MemberType]:
+        """If D is a dictionary, each(D).value returns a sequence-like EachContainer of each value in D, in order of key
+           creation, which engages in vectorized ops by position rather than by key.  This wraps a live PositionalView
+           of D's values, so no copy of them is made, it will reflect any later changes to D, and it can be indexed by
+           position, like `each(D).value[0]`, though each such lookup walks D's values up to that position.  The view
+           is read-only, so assigning by position, like `each(D).value[0] = 5`, raises TypeError.  Like .key, this
+           takes precedence over distributed attribute access, so if D's values have a .value attribute of their own,
+           as enum members do, get each of those with `each(D.values()).value` instead."""
+        return EachContainer(PositionalView(self.whole.values()), nested=self._each_nested)
+
     def items(self) -> EachContainer[Tuple[KeyType, MemberType]]:
         """If D is a dictionary, each(D).item and each(D).items() return an EachContainer of each item in D, as
-           a (key, value) tuple, in order of key creation.  It is often easier to use each(D).key and each(D).value"""
-        return EachContainer(self.whole.items())
+           a (key, value) tuple, in order of key creation.  It is often easier to use each(D).key and each(D).value
+           Unlike each(D).value, this holds a list of D's items, made when called, so it can be indexed directly."""
+        return EachContainer(list(self.whole.items()))
     item = property(items)
 
     @overload
@@ -1217,7 +1948,12 @@ class EachMapping(EachContainer[MemberType], MutableMapping[KeyType, MemberType]
     def __getattr__(self, attr):
         """each(D).attr creates a new EachMapping mapping each of D's keys to the corresponding value.attr.
            I.e. it distributes fetching .attr over each of D's values."""
-        return EachMapping({key: getattr(value, attr) for key, value in self.whole.items()})
+        whole, getter = self.whole, attribute_getter(attr)
+        if type(whole) is dict:  # A copy of a dict reuses its hash table, so keys needn't be inserted afresh
+            result = whole.copy()
+            result.update(zip(whole.keys(), map(getter, whole.values())))
+            return EachMapping(result)
+        return EachMapping(dict(zip(whole.keys(), map(getter, whole.values()))))
 
 
 class EachSet(EachMapping[MemberType,MemberType]):
@@ -1239,11 +1975,13 @@ class EachSet(EachMapping[MemberType,MemberType]):
        Note that so-called "set arithmetic" operations like `each(S) & X` will be distributed across each member of S,
        since that's what each() does! If you want an intersection of whole sets, use `S & X` or `each(S).whole & X`."""
 
+    __slots__ = ()
+
     whole: Set
 
     def __init__(self, whole: Union[Set[MemberType],Mapping[MemberType,MemberType]],
                        nested: Union[int, bool, None] = next):
-        if isinstance(whole, Mapping):
+        if is_mapping(whole):
             whole = whole.keys()
         super().__init__(whole, nested=nested)
 
@@ -1257,6 +1995,10 @@ class EachSet(EachMapping[MemberType,MemberType]):
     def values(self) -> Collection[MemberType]:
         return self.whole
 
+    @property  # As with .key, this shadows members' own .value, so each(S).value won't fetch e.g. enum members' values
+    def value(self) -> EachContainer[MemberType]:
+        return EachContainer(PositionalView(self.whole), nested=self._each_nested)
+
     def items(self) -> 'EachContainer[Tuple[MemberType, MemberType]]':
         return EachContainer(zip(self.whole, self.whole))
 
@@ -1266,12 +2008,16 @@ class EachSet(EachMapping[MemberType,MemberType]):
 
     #TODO not sure if I need to repeat all the overloading?  Could just move this to a special case in superclass
     def __getitem__(self, item):
-        if isinstance(item, slice) or (isinstance(item, Iterable) and not isinstance(item, str)):
+        if type(item) is slice or is_plural(item):
             return super().__getitem__(item)
         if item in self.whole: return item
         raise KeyError(f"{item}")
 
 
+# For each source_kind of sized plural source, the sort of EachContainer that each(source) will wrap it in
+each_types = {'mapping': EachMapping, 'set': EachSet, 'collection': EachContainer}
+
+
 
 
 